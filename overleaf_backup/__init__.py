@@ -1,5 +1,5 @@
 from overleaf_backup.utils.dotenv import load_dotenv
-from overleaf_backup.utils.logging import setup_logging, set_log_level
+from overleaf_backup.utils.logging import setup_logging, set_log_format, set_log_level
 
 setup_logging()
 load_dotenv()
@@ -8,3 +8,4 @@ from overleaf_backup.utils.config import Configuration
 
 config = Configuration()
 set_log_level(config.logging.level)
+set_log_format(config.logging.format)
@@ -3,18 +3,22 @@ import sys
 from pathlib import Path
 
 from overleaf_backup import config
-from overleaf_backup.backup import backup, fetch
+from overleaf_backup.backup import CHECKPOINT_FILE, CLONE_FOLDER, backup, fetch
+from overleaf_backup.checkpoint import read_checkpoint
+from overleaf_backup.maintenance import maintain
 from overleaf_backup.overleaf import read_project_list, save_project_list
+from overleaf_backup.plan import create_plan, save_plan
 from overleaf_backup.utils.args import Modes, parse_args
 from overleaf_backup.utils.config import Configuration
 
 
-def full_mode(config: Configuration) -> None:
+def full_mode(config: Configuration, resume: bool) -> None:
     """
     Runs the program in full mode. It fetches the project list from Overleaf
     and takes backups of these.
 
     :param config: The program configuration file.
+    :param resume: Skip the projects completed in the last, interrupted, run.
     """
     logging.info("Running in full mode: This will perform a complete backup and fetch.")
 
@@ -24,15 +28,16 @@ def full_mode(config: Configuration) -> None:
         logging.critical("No projects found, unable to take backups")
         sys.exit(1)
 
-    backup(config, projects)
+    backup(config, projects, resume)
 
 
-def backup_mode(path: str, config: Configuration) -> None:
+def backup_mode(path: str, config: Configuration, resume: bool) -> None:
     """
     Runs the program in backup mode. It uses a prefetched project list and takes backup of it.
 
     :param path: A file path for where to save the project list.
     :param config: The program configuration file.
+    :param resume: Skip the projects completed in the last, interrupted, run.
     """
     if not Path(path).exists():
         logging.critical(
@@ -40,7 +45,7 @@ def backup_mode(path: str, config: Configuration) -> None:
         )
         sys.exit(1)
 
-    logging.info(f"Running in backup mode: Using file '{path}' for the backup.")
+    logging.info("Running in backup mode: Using file '%s' for the backup.", path)
 
     projects = read_project_list(path)
 
@@ -48,7 +53,7 @@ def backup_mode(path: str, config: Configuration) -> None:
         logging.critical("Unable to find any projects, cannot take backup.")
         sys.exit(1)
 
-    backup(config, projects)
+    backup(config, projects, resume)
 
 
 def fetch_mode(path: str, config: Configuration) -> None:
@@ -59,13 +64,62 @@ def fetch_mode(path: str, config: Configuration) -> None:
     :param path: A file path for where to save the project list.
     :param config: The program configuration file.
     """
-    logging.info(f"Running in fetch mode: Saving projects to '{path}'.")
+    logging.info("Running in fetch mode: Saving projects to '%s'.", path)
 
     projects = fetch(config)
 
     save_project_list(projects, path)
 
 
+def maintain_mode(config: Configuration) -> None:
+    """
+    Runs the program in maintain mode. It runs git maintenance on the
+    locally cloned projects, e.g. in idle time between backups.
+
+    :param config: The program configuration file.
+    """
+    logging.info("Running in maintain mode: Maintaining the cloned projects.")
+
+    maintain(config.maintenance, CLONE_FOLDER)
+
+
+def plan_mode(path: str, config: Configuration, resume: bool) -> None:
+    """
+    Runs the program in plan mode. It fetches the project list from Overleaf
+    and saves the work a backup would do to a file, without creating, cloning
+    or pushing anything.
+
+    :param path: A file path for where to save the plan.
+    :param config: The program configuration file.
+    :param resume: Plan to skip the projects completed in the last, interrupted, run.
+    """
+    logging.info("Running in plan mode: Saving plan to '%s'.", path)
+
+    projects = fetch(config)
+
+    if not projects:
+        logging.critical("No projects found, unable to create plan.")
+        sys.exit(1)
+
+    completed = read_checkpoint(CHECKPOINT_FILE) if resume else set()
+    try:
+        plan = create_plan(config, projects, completed)
+    except ValueError as e:
+        logging.critical("Unable to create plan: %s.", e)
+        sys.exit(1)
+
+    summary = plan["summary"]
+
+    logging.info(
+        "Plan: %s, transferring about %d bytes in about %d seconds.",
+        ", ".join(f"{count} {action}" for action, count in summary["actions"].items()),
+        summary["transfer_bytes"],
+        summary["estimated_seconds"],
+    )
+
+    save_plan(plan, path)
+
+
 def main() -> None:
     """
     The main function that runs the program in the correct mode.
@@ -75,18 +129,22 @@ def main() -> None:
 
         match args.mode:
             case Modes.FULL:
-                full_mode(config)
+                full_mode(config, args.resume)
             case Modes.BACKUP:
-                backup_mode(args.file, config)
+                backup_mode(args.file, config, args.resume)
             case Modes.FETCH:
                 fetch_mode(args.file, config)
+            case Modes.MAINTAIN:
+                maintain_mode(config)
+            case Modes.PLAN:
+                plan_mode(args.plan, config, args.resume)
             case _:
                 logging.critical(
-                    f"Invalid mode. Valid options: {[m.value for m in Modes]}."
+                    "Invalid mode. Valid options: %s.", [m.value for m in Modes]
                 )
                 sys.exit(1)
     except Exception as e:
-        logging.debug(f"Unknown error caught from main: {e}")
+        logging.debug("Unknown error caught from main: %s", e)
         logging.critical("Unknown critical error occured.")
         sys.exit(1)
 
@@ -5,9 +5,15 @@ from pathlib import Path
 
 import regex
 
+from overleaf_backup.checkpoint import Checkpoint, read_checkpoint
 from overleaf_backup.git import GitLab
+from overleaf_backup.maintenance import maintain
 from overleaf_backup.overleaf import Overleaf
 from overleaf_backup.utils.config import Configuration
+from overleaf_backup.utils.logging import log_context
+
+CLONE_FOLDER = Path("clone_folder")
+CHECKPOINT_FILE = CLONE_FOLDER / "checkpoint.jsonl"
 
 
 class OverleafRepo:
@@ -34,14 +40,18 @@ class OverleafRepo:
         self.__overleaf_project_id = overleaf_project_id
         self.__backup_url = backup_url
         logging.debug(
-            f"Clone path entered to OverleafRepo is {clone_path.absolute()} for project {overleaf_project_id}."
+            "Clone path entered to OverleafRepo is %s for project %s.",
+            clone_path.absolute(),
+            overleaf_project_id,
         )
         self.__clone_path = clone_path.absolute()
         self.__config = config
 
-    def clone_repo(self):
+    def clone_repo(self) -> bool:
         """
         Clone the Overleaf repository into the clone path.
+
+        :return: If the repository was cloned or pulled.
         """
         if Path(f"{self.__clone_path}/{self.__overleaf_project_id}").exists():
             if self.__run_git_command(
@@ -52,11 +62,11 @@ class OverleafRepo:
                     "pull",
                 ]
             ):
-                logging.info(f"{self.__overleaf_project_id} was successfully pulled.")
-            else:
-                logging.error(f"Unable to pull {self.__overleaf_project_id}.")
+                logging.info("%s was successfully pulled.", self.__overleaf_project_id)
+                return True
 
-            return
+            logging.error("Unable to pull %s.", self.__overleaf_project_id)
+            return False
 
         # Cloning the repo if it is not already cloned
         if self.__run_git_command(
@@ -69,43 +79,65 @@ class OverleafRepo:
             ]
         ):
             logging.info(
-                f"Was able to clone {self.__overleaf_url} into {self.__clone_path}"
-            )
-        else:
-            logging.error(
-                f"Unable to clone {self.__overleaf_url} into {self.__clone_path}"
+                "Was able to clone %s into %s", self.__overleaf_url, self.__clone_path
             )
+            return True
 
-    def add_remote(self, remote_name: str = "backup"):
+        logging.error(
+            "Unable to clone %s into %s", self.__overleaf_url, self.__clone_path
+        )
+        return False
+
+    def add_remote(self, remote_name: str = "backup") -> bool:
         """
-        Adds the backup remote to the cloned Overleaf project.
+        Adds the backup remote to the cloned Overleaf project. If the remote
+        already exists, its url is set to the backup url.
 
         :param remote_name: The name of the remote.
+        :return: If the remote points to the backup url.
         """
+        repo_path = f"{self.__clone_path}/{self.__overleaf_project_id}"
+
+        if self.__run_git_command(
+            ["git", "-C", repo_path, "remote", "add", remote_name, self.__backup_url],
+        ):
+            logging.info(
+                "Successfully added remote %s to %s.",
+                remote_name,
+                self.__overleaf_project_id,
+            )
+            return True
+
+        # The remote exists from an earlier run, but the backup url may have changed
         if self.__run_git_command(
             [
                 "git",
                 "-C",
-                f"{self.__clone_path}/{self.__overleaf_project_id}",
+                repo_path,
                 "remote",
-                "add",
+                "set-url",
                 remote_name,
                 self.__backup_url,
             ],
         ):
             logging.info(
-                f"Successfully added remote {remote_name} to {self.__overleaf_project_id}."
-            )
-        else:
-            logging.error(
-                f"Unable to add remote {remote_name} to {self.__overleaf_project_id}. This might be because the remote already exists."
+                "Successfully set url of remote %s in %s.",
+                remote_name,
+                self.__overleaf_project_id,
             )
+            return True
+
+        logging.error(
+            "Unable to add remote %s to %s.", remote_name, self.__overleaf_project_id
+        )
+        return False
 
-    def push(self, remote_name: str = "backup"):
+    def push(self, remote_name: str = "backup") -> bool:
         """
         Pushes the Overleaf project to the backup remote.
 
         :param remote_name: The name of the remote
+        :return: If the project was pushed.
         """
         if self.__run_git_command(
             [
@@ -117,12 +149,14 @@ class OverleafRepo:
             ],
         ):
             logging.info(
-                f"Successfully pushed {self.__overleaf_project_id} to {remote_name}."
-            )
-        else:
-            logging.error(
-                f"Unable to push {self.__overleaf_project_id} to {remote_name}."
+                "Successfully pushed %s to %s.", self.__overleaf_project_id, remote_name
             )
+            return True
+
+        logging.error(
+            "Unable to push %s to %s.", self.__overleaf_project_id, remote_name
+        )
+        return False
 
     def __run_git_command(self, command: list) -> bool:
         """
@@ -152,11 +186,13 @@ class OverleafRepo:
 
         if result.returncode == 0:
             logging.debug(
-                f"Command '{command}' was successful with output: {result.stdout}."
+                "Command '%s' was successful with output: %s.", command, result.stdout
             )
         else:
             logging.debug(
-                f"Command '{command}' was unsuccessful, with output: {result.stderr}."
+                "Command '%s' was unsuccessful, with output: %s.",
+                command,
+                result.stderr,
             )
 
         return result.returncode == 0
@@ -180,6 +216,34 @@ def transform_string_unicode(s):
     return s
 
 
+def get_repo_name(project: dict) -> str:
+    """
+    Gets the name of the GitLab repo used as backup for an Overleaf project.
+
+    :param project: The Overleaf project.
+    :return: The name of the backup repo.
+    """
+    return transform_string_unicode(f"{project['id']}-{project['name']}")
+
+
+def unique_projects(overleaf_projects: list) -> list:
+    """
+    Removes projects listed more than once, keeping the first occurrence.
+
+    :param overleaf_projects: A list of Overleaf projects.
+    :return: The projects without duplicates.
+    """
+    seen = set()
+    projects = []
+
+    for project in overleaf_projects:
+        if project["id"] not in seen:
+            seen.add(project["id"])
+            projects.append(project)
+
+    return projects
+
+
 def fetch(config: Configuration) -> list:
     """
     Fetches project list from Overleaf.
@@ -194,46 +258,102 @@ def fetch(config: Configuration) -> list:
 
     overleaf_projects = overleaf.parse_project_list(project_list)
 
-    logging.info(f"Found {len(overleaf_projects)} projects in Overleaf")
+    logging.info("Found %d projects in Overleaf", len(overleaf_projects))
 
     return overleaf_projects
 
 
-def backup(config: Configuration, overleaf_projects: list) -> None:
+def backup(
+    config: Configuration, overleaf_projects: list, resume: bool = False
+) -> None:
     """
     Signs in to GitLab, downloads git projects from Overleaf and pushes them to GitLab.
+    Each finished project is written to a checkpoint journal, so that an
+    interrupted run can be resumed.
 
     :param config: The program configuration.
     :param overleaf_projects: A list of all projects to take backups of.
+    :param resume: Skip the projects completed in the last, interrupted, run.
     """
     gitlab_obj = GitLab(config.gitlab)
 
-    Path("clone_folder").mkdir(exist_ok=True)
+    CLONE_FOLDER.mkdir(exist_ok=True)
+
+    overleaf_projects = unique_projects(overleaf_projects)
+
+    completed = read_checkpoint(CHECKPOINT_FILE) if resume else set()
+    checkpoint = Checkpoint(CHECKPOINT_FILE, completed)
+
+    if completed:
+        logging.info(
+            "Resuming backup, skipping %d projects completed in the last run.",
+            len(completed),
+        )
+        overleaf_projects = [
+            project for project in overleaf_projects if project["id"] not in completed
+        ]
+
+    gitlab_urls = gitlab_obj.create_projects(
+        {project["id"]: get_repo_name(project) for project in overleaf_projects}
+    )
 
     for project in overleaf_projects:
-        logging.info(f"Backing up project {project['name']} with id {project['id']}.")
-        try:
-            repo_name = transform_string_unicode(f"{project['id']}-{project['name']}")
-            gitlab_url = gitlab_obj.create_project(repo_name)
-            if not gitlab_url:
-                logging.debug(
-                    f"Unable to find backup url for project {repo_name} for Overleaf project {project['name']} with id {project['id']}."
-                )
-                raise ValueError("Unable to get the backup url for the project.")
-
-            logging.debug(f"Backup url: {gitlab_url}")
-
-            overleaf_repo = OverleafRepo(
-                config, project["id"], gitlab_url, Path("clone_folder")
-            )
-            overleaf_repo.clone_repo()
-            overleaf_repo.add_remote()
-            overleaf_repo.push()
+        with log_context(project=project["id"]):
+            success = __backup_project(config, project, gitlab_urls.get(project["id"]))
 
-            logging.info(
-                f"Successfully backed up {project['name']} with id {project['id']} to {gitlab_url}."
-            )
-        except Exception as e:
-            logging.error(
-                f"Unable to backup project {project['name']} with id {project['id']}. Unknown error: {e}"
+        checkpoint.record(project["id"], success)
+
+    checkpoint.finish()
+
+    if config.maintenance.enabled:
+        maintain(config.maintenance, CLONE_FOLDER)
+
+
+def __backup_project(config: Configuration, project: dict, gitlab_url: str) -> bool:
+    """
+    Takes a backup of a single Overleaf project to GitLab.
+
+    :param config: The program configuration.
+    :param project: The Overleaf project to take backup of.
+    :param gitlab_url: The url to the backup repository.
+    :return: If the project was cloned or pulled and pushed.
+    """
+    logging.info("Backing up project %s with id %s.", project["name"], project["id"])
+    try:
+        repo_name = get_repo_name(project)
+        if not gitlab_url:
+            logging.debug(
+                "Unable to find backup url for project %s for Overleaf project %s with id %s.",
+                repo_name,
+                project["name"],
+                project["id"],
             )
+            raise ValueError("Unable to get the backup url for the project.")
+
+        logging.debug("Backup url: %s", gitlab_url)
+
+        overleaf_repo = OverleafRepo(config, project["id"], gitlab_url, CLONE_FOLDER)
+        with log_context(phase="clone"):
+            cloned = overleaf_repo.clone_repo()
+        with log_context(phase="push"):
+            remote_added = overleaf_repo.add_remote()
+            pushed = overleaf_repo.push()
+
+        if not (cloned and remote_added and pushed):
+            return False
+
+        logging.info(
+            "Successfully backed up %s with id %s to %s.",
+            project["name"],
+            project["id"],
+            gitlab_url,
+        )
+        return True
+    except Exception as e:
+        logging.error(
+            "Unable to backup project %s with id %s. Unknown error: %s",
+            project["name"],
+            project["id"],
+            e,
+        )
+        return False
@@ -0,0 +1,107 @@
+import json
+import logging
+import os
+from pathlib import Path
+
+
+def read_checkpoint(path: Path) -> set[str]:
+    """
+    Reads the projects completed in the last backup run from the checkpoint journal.
+
+    :param path: The path of the checkpoint journal.
+    :return: The ids of the completed projects. Empty if there is no journal or
+        the last run finished, as there is nothing to resume then.
+    """
+    entries = []
+
+    try:
+        with open(path, "r") as file:
+            for number, line in enumerate(file, start=1):
+                if not line.strip():
+                    continue
+
+                # A run killed while writing leaves a partial last line
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logging.warning(
+                        "Skipping malformed line %d in the checkpoint.", number
+                    )
+    except FileNotFoundError:
+        logging.info("No checkpoint found, nothing to resume.")
+        return set()
+    except Exception as e:
+        logging.debug("Error reading checkpoint %s", e)
+        logging.error("Unable to read the checkpoint, nothing to resume.")
+        return set()
+
+    if entries and entries[-1].get("status") == "finished":
+        logging.info("The last run finished, nothing to resume.")
+        return set()
+
+    # The last entry of a project wins, so a failed retry is retried again
+    statuses = {entry["id"]: entry["status"] for entry in entries if "id" in entry}
+
+    return {
+        project_id for project_id, status in statuses.items() if status == "completed"
+    }
+
+
+class Checkpoint:
+    """
+    Journal of the projects backed up in a run. An entry is written after each
+    project, so that an interrupted run can be resumed.
+    """
+
+    def __init__(self, path: Path, completed: set[str] | None = None):
+        """
+        Starts a new journal, replacing the journal of the last run.
+
+        :param path: The path of the checkpoint journal.
+        :param completed: Projects completed in a resumed run. They are kept in the
+            new journal, so they are skipped again if this run is interrupted as well.
+        """
+        self.__path = path
+
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as file:
+            for project_id in completed or set():
+                file.write(json.dumps({"id": project_id, "status": "completed"}) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+
+        # The rename is only durable once the folder is synced
+        folder = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(folder)
+        finally:
+            os.close(folder)
+
+    def record(self, project_id: str, completed: bool) -> None:
+        """
+        Records that the backup of a project is done.
+
+        :param project_id: The id of the Overleaf project.
+        :param completed: If the project was backed up, failed projects are retried
+            when resuming.
+        """
+        self.__write(
+            {"id": project_id, "status": "completed" if completed else "failed"}
+        )
+
+    def finish(self) -> None:
+        """
+        Records that the run went through all projects.
+        """
+        self.__write({"status": "finished"})
+
+    def __write(self, entry: dict) -> None:
+        try:
+            with open(self.__path, "a") as file:
+                file.write(json.dumps(entry) + "\n")
+                file.flush()
+                os.fsync(file.fileno())
+        except Exception as e:
+            logging.debug("Error writing checkpoint %s", e)
+            logging.error("Unable to write to the checkpoint.")
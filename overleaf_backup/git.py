@@ -1,9 +1,11 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 import gitlab
 from gitlab.exceptions import GitlabCreateError
 
 from overleaf_backup.utils.config import GitLabSettings
+from overleaf_backup.utils.logging import log_context
 
 
 class GitLab:
@@ -21,36 +23,126 @@ class GitLab:
         self.__gl.auth()
 
         if self.__gl.user is not None:
-            logging.info(f"Successfully authenticated as {self.__gl.user.username}")
+            logging.info("Successfully authenticated as %s", self.__gl.user.username)
         else:
             logging.error("Unable to authenticate with GitLab")
             raise gitlab.GitlabAuthenticationError("unable to authenticate with GitLab")
 
+        self.__groups: dict[str, dict] = {}
+        self.__project_index: dict[str, str] | None = None
+
         if self.__config.group:
             self.__group_id = self.group_exists(self.__config.group)
+            self.__namespace = self.__groups[self.__config.group]["full_path"]
         else:
             self.__group_id = None
+            self.__namespace = self.__gl.user.username
 
-    def group_exists(self, group_name: str) -> int:
+    def group_exists(self, group_path: str) -> int:
         """
-        Checks if the specified group exists in GitLab.
+        Checks if the specified group exists in GitLab. The group is looked up
+        by its full path, and the result is cached.
 
-        :param group_name: The name of the group.
+        :param group_path: The full path of the group, e.g. 'parent/backups'.
         :raises ValueError: When unable to find specified GitLab group.
         :return: The group id.
         """
-        groups_found = self.__gl.groups.list(search=group_name)
+        if group_path in self.__groups:
+            return self.__groups[group_path]["id"]
+
+        try:
+            group = self.__gl.groups.get(group_path)
+        except gitlab.GitlabGetError as e:
+            logging.error(
+                "Unable to find GitLab group %s, with error: %s", group_path, e
+            )
+            raise ValueError(f"GitLab group {group_path} does not exist in GitLab")
+
+        self.__groups[group_path] = {"id": int(group.id), "full_path": group.full_path}
+        logging.info("Found GitLab group %s with id: %s.", group.full_path, group.id)
+
+        return int(group.id)
+
+    def project_index(self, fallback: bool = True) -> dict[str, str]:
+        """
+        Lists the projects in the backup namespace. The index is fetched once
+        and then kept up to date by the project creation. If the projects can
+        not be listed the index is empty, and existing projects are found when
+        their creation fails.
+
+        :param fallback: Use an empty index if the projects can not be listed.
+        :raises ValueError: When unable to list the projects and not using the fallback.
+        :return: A mapping from project name to url of the GitLab repo.
+        """
+        if self.__project_index is None:
+            if self.__group_id:
+                owner = self.__gl.groups.get(self.__group_id, lazy=True)
+                # Projects shared into the group belong to other namespaces
+                list_options = {"with_shared": False}
+            else:
+                owner = self.__gl.users.get(self.__gl.user.id, lazy=True)
+                list_options = {}
+
+            try:
+                self.__project_index = {
+                    project.name: project.http_url_to_repo
+                    for project in owner.projects.list(iterator=True, **list_options)
+                }
+            except Exception as e:
+                logging.error(
+                    "Unable to list projects in GitLab namespace %s, with error: %s",
+                    self.__namespace,
+                    e,
+                )
+                if not fallback:
+                    raise ValueError(
+                        f"Unable to list projects in GitLab namespace {self.__namespace}"
+                    )
+
+                self.__project_index = {}
+                return self.__project_index
 
-        if len(groups_found) > 0:
             logging.info(
-                f"Found GitLab group {group_name} with id: {groups_found[0].id}."
+                "Found %d projects in GitLab namespace %s.",
+                len(self.__project_index),
+                self.__namespace,
             )
-            return int(groups_found[0].id)
-        else:
-            logging.error(
-                f"Unable to find GitLab group {group_name} when searching for groups"
+
+        return self.__project_index
+
+    def create_projects(self, project_names: dict[str, str]) -> dict[str, str | None]:
+        """
+        Creates the projects that do not already exist in GitLab. The missing
+        projects are created in parallel, bounded by the max_workers setting.
+
+        :param project_names: A mapping from Overleaf project id to name of the
+            GitLab project.
+        :return: A mapping from Overleaf project id to url of the GitLab repo,
+            None if the project could not be created.
+        """
+        index = self.project_index()
+        missing = {
+            project_id: name
+            for project_id, name in project_names.items()
+            if name not in index
+        }
+
+        logging.info(
+            "Creating %d of %d projects in GitLab.", len(missing), len(project_names)
+        )
+
+        with ThreadPoolExecutor(max_workers=self.__config.max_workers) as executor:
+            urls = executor.map(
+                self.__create_project_with_context, missing.keys(), missing.values()
             )
-            raise ValueError(f"GitLab group {group_name} does not exist in GitLab")
+
+            for project_name, url in zip(missing.values(), urls):
+                if url:
+                    index[project_name] = url
+
+        return {
+            project_id: index.get(name) for project_id, name in project_names.items()
+        }
 
     def create_project(self, project_name: str) -> str:
         """
@@ -59,93 +151,131 @@ class GitLab:
         :param project_name: The name of the project.
         :return: Url to GitLab repo.
         """
+        if self.__project_index and project_name in self.__project_index:
+            return self.__project_index[project_name]
+
         if self.__group_id:
             return self.__create_project_in_group(str(self.__group_id), project_name)
         else:
             return self.__create_project(project_name)
 
+    def __create_project_with_context(self, project_id: str, project_name: str):
+        with log_context(project=project_id, phase="create"):
+            return self.create_project(project_name)
+
+    @staticmethod
+    def __already_taken(error: GitlabCreateError) -> bool:
+        """
+        Checks if the project creation failed because the project already
+        exists, e.g. because it was created by a concurrent run.
+
+        :param error: The error from the project creation.
+        :return: If the project name or path is already taken.
+        """
+        return "has already been taken" in str(error.error_message)
+
     def __create_project(self, project_name: str):
         try:
             project = self.__gl.projects.create({"name": str(project_name)})
             logging.info(
-                f"Successfully created project {project_name} with id {project.id}."
+                "Successfully created project %s with id %s.", project_name, project.id
             )
             return project.http_url_to_repo
         except GitlabCreateError as e:
-            if e.error_message["project_namespace.name"] == ["has already been taken"]:
-                logging.debug(f"Project {project_name} already exists.")
+            if self.__already_taken(e):
+                logging.debug("Project %s already exists.", project_name)
 
                 project = self.__get_project(project_name)
                 if project:
                     return project.http_url_to_repo
 
-            logging.error(f"Unable to create project {project_name}, with error: {e}")
+            logging.error(
+                "Unable to create project %s, with error: %s", project_name, e
+            )
         except gitlab.GitlabAuthenticationError as e:
             logging.error(
-                f"Authentication error when creating project {project_name}, with error: {e}"
+                "Authentication error when creating project %s, with error: %s",
+                project_name,
+                e,
             )
         except Exception as e:
             logging.error(
-                f"Unknown error when creating project {project_name}, with error: {e}"
+                "Unknown error when creating project %s, with error: %s",
+                project_name,
+                e,
             )
 
     def __create_project_in_group(self, group_id: str, project_name: str):
         try:
-            logging.debug(f"Name of project to be created {project_name}")
+            logging.debug("Name of project to be created %s", project_name)
             project = self.__gl.projects.create(
                 {"name": project_name, "namespace_id": group_id}
             )
 
             logging.info(
-                f"Successfully created project {project_name} in namespace {group_id}."
+                "Successfully created project %s in namespace %s.",
+                project_name,
+                group_id,
             )
             return project.http_url_to_repo
         except gitlab.GitlabListError as e:
             logging.error(
-                f"Unable to find group {group_id} when creating project {project_name}, with error: {e}"
+                "Unable to find group %s when creating project %s, with error: %s",
+                group_id,
+                project_name,
+                e,
             )
         except GitlabCreateError as e:
-            if e.error_message["project_namespace.name"] == ["has already been taken"]:
+            if self.__already_taken(e):
                 logging.debug(
-                    f"Project {project_name} in namespace {group_id} already exists."
+                    "Project %s in namespace %s already exists.", project_name, group_id
                 )
 
                 project = self.__get_project(project_name)
                 if project:
                     logging.debug(
-                        f"Found {project_name} in namespace {group_id}, it already existed"
+                        "Found %s in namespace %s, it already existed",
+                        project_name,
+                        group_id,
                     )
                     return project.http_url_to_repo
 
             logging.error(
-                f"Unable to create project {project_name} in namespace {group_id}, with error: {e}"
+                "Unable to create project %s in namespace %s, with error: %s",
+                project_name,
+                group_id,
+                e,
             )
         except gitlab.GitlabAuthenticationError as e:
             logging.error(
-                f"Authentication error when creating project {project_name} in namespace {group_id}, with error: {e}"
+                "Authentication error when creating project %s in namespace %s, with error: %s",
+                project_name,
+                group_id,
+                e,
             )
         except Exception as e:
             logging.error(
-                f"Unknown error when creating project {project_name} in namespace {group_id}, with error: {e}"
+                "Unknown error when creating project %s in namespace %s, with error: %s",
+                project_name,
+                group_id,
+                e,
             )
 
     def __get_project(self, project_name: str):
         try:
-            if self.__group_id:
-                project = self.__gl.projects.get(
-                    f"{self.__config.group}/{project_name}"
-                )
-            else:
-                default_namespace = self.__gl.user.username
-                project = self.__gl.projects.get(f"{default_namespace}/{project_name}")
+            project = self.__gl.projects.get(f"{self.__namespace}/{project_name}")
             return project
         except gitlab.GitlabGetError as e:
-            logging.error(f"Unable to get project {project_name}, with error: {e}")
+            logging.error("Unable to get project %s, with error: %s", project_name, e)
         except gitlab.GitlabAuthenticationError as e:
             logging.error(
-                f"Authentication error when getting project {project_name}, with error: {e}"
+                "Authentication error when getting project %s, with error: %s",
+                project_name,
+                e,
             )
         except Exception as e:
             logging.error(
-                f"Unknown error when getting project {project_name}, with error: {e}"
+                "Unknown error when getting project %s, with error: %s",
+                project_name,
+                e,
             )
@@ -0,0 +1,162 @@
+import logging
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+from overleaf_backup.utils.config import MaintenanceSettings
+from overleaf_backup.utils.logging import log_context
+
+
+def count_objects(repo_path: Path) -> dict[str, int]:
+    """
+    Counts the objects in a git repository using 'git count-objects'.
+
+    :param repo_path: The path to the repository.
+    :return: The statistics of the repository, e.g. 'count' for the number of
+        loose objects and 'packs' for the number of packs. Empty if unable to count.
+    """
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "count-objects", "-v"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    if result.returncode != 0:
+        logging.debug(
+            "Unable to count objects in %s, with output: %s", repo_path, result.stderr
+        )
+        return {}
+
+    stats = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(":")
+        if value.strip().isdigit():
+            stats[key.strip()] = int(value)
+
+    return stats
+
+
+def needs_maintenance(stats: dict[str, int], config: MaintenanceSettings) -> bool:
+    """
+    Checks if a repository has enough loose objects or packs to be maintained.
+
+    :param stats: The repository statistics from count_objects.
+    :param config: The maintenance configuration.
+    :return: If the repository should be maintained.
+    """
+    return (
+        stats.get("count", 0) >= config.loose_objects
+        or stats.get("packs", 0) >= config.packs
+    )
+
+
+def maintain_repo(
+    repo_path: Path, config: MaintenanceSettings, deadline: float | None = None
+) -> bool:
+    """
+    Maintains a git repository. Loose objects and small packs are incrementally
+    repacked into a multi-pack-index, the commit-graph is written and
+    unreachable objects are pruned.
+
+    :param repo_path: The path to the repository.
+    :param config: The maintenance configuration.
+    :param deadline: The time.monotonic() time the commands are stopped at.
+    :return: If all maintenance commands were successful.
+    """
+    git = ["git", "-C", str(repo_path), "-c", f"pack.threads={config.threads}"]
+    commands = [
+        [*git, "repack", "-d", "-l", "--geometric=2", "--write-midx"],
+        [*git, "commit-graph", "write", "--reachable", "--split"],
+        [*git, "prune", f"--expire={config.prune_expire}"],
+    ]
+
+    return all(__run_command(command, deadline) for command in commands)
+
+
+def maintain(config: MaintenanceSettings, clone_path: Path) -> None:
+    """
+    Maintains the repositories in the clone folder that need it. The
+    repositories with most loose objects are maintained first. Once the time
+    budget is used, the running command is stopped and no new repository is
+    started.
+
+    :param config: The maintenance configuration.
+    :param clone_path: The folder containing the cloned repositories.
+    """
+    if not clone_path.exists():
+        logging.info("No clone folder found, skipping maintenance.")
+        return
+
+    repos = []
+    for repo_path in clone_path.iterdir():
+        if not (repo_path / ".git").exists():
+            continue
+
+        stats = count_objects(repo_path)
+        if needs_maintenance(stats, config):
+            repos.append((stats.get("count", 0), repo_path))
+
+    repos.sort(key=lambda repo: repo[0], reverse=True)
+
+    logging.info("Running maintenance on %d repositories.", len(repos))
+
+    deadline = time.monotonic() + config.time_budget
+    maintained = 0
+
+    for _, repo_path in repos:
+        if time.monotonic() >= deadline:
+            logging.info(
+                "Maintenance time budget of %d seconds used, %d repositories left.",
+                config.time_budget,
+                len(repos) - maintained,
+            )
+            break
+
+        with log_context(project=repo_path.name, phase="maintenance"):
+            if maintain_repo(repo_path, config, deadline):
+                logging.info("Successfully maintained %s.", repo_path.name)
+            else:
+                logging.error("Unable to maintain %s.", repo_path.name)
+
+        maintained += 1
+
+
+def __run_command(command: list, deadline: float | None = None) -> bool:
+    """
+    Runs a maintenance command with low CPU and I/O priority.
+
+    :param command: A list of commands to run.
+    :param deadline: The time.monotonic() time the command is stopped at.
+    :return: If the command was successful.
+    """
+    if shutil.which("ionice"):
+        command = ["ionice", "-c", "3", *command]
+    if shutil.which("nice"):
+        command = ["nice", "-n", "19", *command]
+
+    timeout = max(deadline - time.monotonic(), 0) if deadline is not None else None
+
+    try:
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        logging.warning("Command '%s' was stopped by the time budget.", command)
+        return False
+
+    if result.returncode == 0:
+        logging.debug(
+            "Command '%s' was successful with output: %s.", command, result.stdout
+        )
+    else:
+        logging.debug(
+            "Command '%s' was unsuccessful, with output: %s.", command, result.stderr
+        )
+
+    return result.returncode == 0
@@ -76,7 +76,9 @@ class Overleaf:
         except Exception as e:
             logging.error("Unable to parse project list from Overleaf.")
             logging.debug(
-                f"Unable to parse projects with error {e}. HTML contents: {html_project_list}"
+                "Unable to parse projects with error %s. HTML contents: %s",
+                e,
+                html_project_list,
             )
 
             return []
@@ -112,7 +114,7 @@ def save_project_list(projects: list, path: str) -> bool:
 
         return True
     except Exception as e:
-        logging.debug(f"Error writing project list {e}")
+        logging.debug("Error writing project list %s", e)
         logging.error("Unable to save the project list to file.")
         return False
 
@@ -120,6 +122,7 @@ def save_project_list(projects: list, path: str) -> bool:
 def read_project_list(path: str) -> list:
     """
     Reads the project list saved on the file system of Overleaf projects to backup.
+    Both the file from the fetch mode and the plan from the plan mode can be read.
 
     :param path: The path of the project list.
     :return: The project list.
@@ -128,8 +131,11 @@ def read_project_list(path: str) -> list:
         with open(path, "r") as file:
             data = json.loads(file.read())
 
+        if isinstance(data, dict):
+            return data["projects"]
+
         return data
     except Exception as e:
-        logging.debug(f"Error read project list {e}")
+        logging.debug("Error read project list %s", e)
         logging.error("Unable to read the project list from file.")
         return []
@@ -0,0 +1,159 @@
+import json
+import logging
+from pathlib import Path
+
+from overleaf_backup.backup import CLONE_FOLDER, get_repo_name
+from overleaf_backup.git import GitLab
+from overleaf_backup.maintenance import count_objects
+from overleaf_backup.utils.config import Configuration
+
+# Rough costs used to estimate the duration of a plan.
+API_REQUEST_SECONDS = 1.0
+GIT_COMMAND_SECONDS = 2.0
+TRANSFER_BYTES_PER_SECOND = 1_000_000
+DEFAULT_REPO_BYTES = 1_000_000
+
+
+def repo_size(repo_path: Path) -> int:
+    """
+    Gets the size of the objects in a local git repository.
+
+    :param repo_path: The path to the repository.
+    :return: The size in bytes, 0 if unable to find it.
+    """
+    stats = count_objects(repo_path)
+
+    return (stats.get("size", 0) + stats.get("size-pack", 0)) * 1024
+
+
+def create_plan(
+    config: Configuration, overleaf_projects: list, completed: set[str] | None = None
+) -> dict:
+    """
+    Computes the work a backup of the projects would do, without changing
+    anything locally or in GitLab.
+
+    Each project gets a list of actions: 'create' if the GitLab project is
+    missing, 'clone' or 'pull' depending on the local clone, and 'push'.
+    Projects listed more than once or completed in a resumed run are skipped.
+
+    :param config: The program configuration.
+    :param overleaf_projects: A list of all projects to take backups of.
+    :param completed: The projects completed in the run to resume.
+    :raises ValueError: When unable to list the projects in GitLab, as every
+        project would then be planned to be created.
+    :return: The plan with a summary, the projects to backup and the skipped projects.
+    """
+    gitlab_index = GitLab(config.gitlab).project_index(fallback=False)
+    completed = completed or set()
+
+    local_sizes = {
+        project["id"]: repo_size(CLONE_FOLDER / project["id"])
+        for project in overleaf_projects
+        if (CLONE_FOLDER / project["id"]).exists()
+    }
+    # New clones are estimated to be as large as the average local clone
+    clone_size = (
+        sum(local_sizes.values()) // len(local_sizes)
+        if local_sizes
+        else DEFAULT_REPO_BYTES
+    )
+
+    projects = []
+    skipped = []
+    seen = set()
+
+    for project in overleaf_projects:
+        entry = {
+            "id": project["id"],
+            "name": project["name"],
+            "repo": get_repo_name(project),
+            "actions": [],
+            "transfer_bytes": 0,
+        }
+
+        if project["id"] in seen:
+            entry["actions"].append("skip")
+            entry["reason"] = "duplicate"
+            skipped.append(entry)
+            continue
+
+        seen.add(project["id"])
+
+        if project["id"] in completed:
+            entry["actions"].append("skip")
+            entry["reason"] = "completed"
+            skipped.append(entry)
+            continue
+
+        size = local_sizes.get(project["id"], clone_size)
+
+        if entry["repo"] not in gitlab_index:
+            entry["actions"].append("create")
+            # The complete repository is pushed to a new GitLab project
+            entry["transfer_bytes"] += size
+
+        if project["id"] in local_sizes:
+            entry["actions"].append("pull")
+        else:
+            entry["actions"].append("clone")
+            entry["transfer_bytes"] += size
+
+        entry["actions"].append("push")
+        projects.append(entry)
+
+    return {
+        "summary": __summarize(config, projects, skipped),
+        "projects": projects,
+        "skipped": skipped,
+    }
+
+
+def __summarize(config: Configuration, projects: list, skipped: list) -> dict:
+    """
+    Summarizes the actions of a plan and estimates its transfer size and duration.
+
+    :param config: The program configuration.
+    :param projects: The projects to backup.
+    :param skipped: The projects that are skipped.
+    :return: The summary of the plan.
+    """
+    actions = {"create": 0, "clone": 0, "pull": 0, "push": 0, "skip": len(skipped)}
+    for project in projects:
+        for action in project["actions"]:
+            actions[action] += 1
+
+    transfer_bytes = sum(project["transfer_bytes"] for project in projects)
+    git_commands = actions["clone"] + actions["pull"] + actions["push"]
+
+    # Project creation is done in parallel, the git commands are not
+    estimated_seconds = (
+        actions["create"] * API_REQUEST_SECONDS / config.gitlab.max_workers
+        + git_commands * GIT_COMMAND_SECONDS
+        + transfer_bytes / TRANSFER_BYTES_PER_SECOND
+    )
+
+    return {
+        "actions": actions,
+        "transfer_bytes": transfer_bytes,
+        "estimated_seconds": round(estimated_seconds),
+    }
+
+
+def save_plan(plan: dict, path: str) -> bool:
+    """
+    Save a plan as a JSON file. The file can be used as project list in the backup mode.
+
+    :param plan: The plan from create_plan.
+    :param path: The path to save the plan to.
+    :return: If the plan was saved.
+    """
+    try:
+        with open(path, "w") as file:
+            file.write(json.dumps(plan, indent=2))
+
+        return True
+    except Exception as e:
+        logging.debug("Error writing plan %s", e)
+        logging.error("Unable to save the plan to file.")
+        return False
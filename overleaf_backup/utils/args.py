@@ -10,6 +10,8 @@ class Modes(Enum):
     FULL = "full"
     BACKUP = "backup"
     FETCH = "fetch"
+    MAINTAIN = "maintain"
+    PLAN = "plan"
 
     def __str__(self):
         return self.value
@@ -31,7 +33,7 @@ def parse_args() -> argparse.Namespace:
         "mode",
         type=Modes,
         choices=Modes,
-        help="Mode to run the program in. Full fetches project list from Overleaf and takes the backup. Backup uses the exported project file from the 'fetch' mode to only take the backup. Fetch downloads the a list of all projects from Overleaf and saves them to a file.",
+        help="Mode to run the program in. Full fetches project list from Overleaf and takes the backup. Backup uses the exported project file from the 'fetch' mode to only take the backup. Fetch downloads the a list of all projects from Overleaf and saves them to a file. Maintain runs git maintenance on the locally cloned projects. Plan fetches the project list from Overleaf and saves the work a backup would do to a file, without changing anything.",
         default=Modes.FULL,
     )
 
@@ -43,4 +45,19 @@ def parse_args() -> argparse.Namespace:
         default="projects.json",
     )
 
+    parser.add_argument(
+        "-p",
+        "--plan",
+        type=str,
+        help="The file to save the plan to in plan mode. It can be used as the file for the backup mode. Default: 'plan.json'.",
+        default="plan.json",
+    )
+
+    parser.add_argument(
+        "-r",
+        "--resume",
+        action="store_true",
+        help="Skip the projects completed in the last run, if it was interrupted. Used by the full, backup and plan modes.",
+    )
+
     return parser.parse_args()
@@ -17,12 +17,27 @@ class GitLabSettings(BaseSettings):
     username: str
     access_token: SecretStr
     group: str = Field("")
+    max_workers: int = Field(4, strict=False, gt=0)
 
     model_config = SettingsConfigDict(frozen=True, strict=True, env_prefix="GITLAB_")
 
 
+class MaintenanceSettings(BaseSettings):
+    enabled: bool = Field(True, strict=False)
+    loose_objects: int = Field(100, strict=False, ge=0)
+    packs: int = Field(10, strict=False, ge=0)
+    threads: int = Field(1, strict=False, gt=0)
+    time_budget: int = Field(300, strict=False, ge=0)
+    prune_expire: str = Field("2.weeks.ago")
+
+    model_config = SettingsConfigDict(
+        frozen=True, strict=True, env_prefix="MAINTENANCE_"
+    )
+
+
 class LoggingSettings(BaseSettings):
     level: str = "info"
+    format: str = "text"
 
     model_config = SettingsConfigDict(frozen=True, strict=True, env_prefix="LOGGING_")
 
@@ -30,6 +45,7 @@ class LoggingSettings(BaseSettings):
 class Configuration(BaseSettings):
     overleaf: OverleafSettings = OverleafSettings()
     gitlab: GitLabSettings = GitLabSettings()
+    maintenance: MaintenanceSettings = MaintenanceSettings()
     logging: LoggingSettings = LoggingSettings()
 
     model_config = SettingsConfigDict(frozen=True, strict=True)
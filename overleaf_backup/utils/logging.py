@@ -1,5 +1,17 @@
+import atexit
+import copy
+import json
 import logging
-from logging import Formatter, StreamHandler, getLogger
+import queue
+from contextlib import contextmanager
+from contextvars import ContextVar
+from logging import Filter, Formatter, LogRecord, StreamHandler, getLogger
+from logging.handlers import QueueHandler, QueueListener
+
+_log_context: ContextVar[dict] = ContextVar("log_context", default={})
+
+_stream_handler = StreamHandler()
+_listener: QueueListener | None = None
 
 
 def __get_log_level(log_level: str) -> int:
@@ -20,21 +32,125 @@ def __get_log_level(log_level: str) -> int:
     elif log_level == "critical":
         return logging.CRITICAL
     else:
-        logging.warning(f"{log_level} is not a valid log level, defaulting to info.")
+        logging.warning("%s is not a valid log level, defaulting to info.", log_level)
         return logging.INFO
-    
+
+
+class ContextFilter(Filter):
+    """
+    Attaches the fields set with `log_context` to every log record.
+
+    The filter runs in the thread that emitted the record, before it is put on
+    the queue, so the context of the emitting thread is the one that is recorded.
+    """
+
+    def filter(self, record: LogRecord) -> bool:
+        context = _log_context.get()
+        record.context = context
+        record.context_str = " ".join(f"{k}={v}" for k, v in context.items())
+        return True
+
+
+class ContextQueueHandler(QueueHandler):
+    """
+    Queue handler that prepares records without formatting them, so the
+    formatter of the listener decides how the message and traceback are shown.
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+
+        # The traceback can not be kept, so it is rendered in the emitting thread
+        if record.exc_info:
+            record.exc_text = Formatter().formatException(record.exc_info)
+            record.exc_info = None
+
+        return record
+
+
+class JsonFormatter(Formatter):
+    """
+    Formats log records as a single line JSON object including the context fields.
+    """
+
+    def format(self, record: LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "context", {}))
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+
+        return json.dumps(entry, default=str)
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    Adds the given fields to all log records emitted within the block.
+
+    Nested blocks extend the context of the outer block.
+
+    :param fields: The context fields, e.g. project and phase.
+    """
+    token = _log_context.set({**_log_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _log_context.reset(token)
+
+
 def set_log_level(log_level: str):
     getLogger().setLevel(__get_log_level(log_level))
 
 
+def set_log_format(log_format: str):
+    """
+    Sets the format of the log output.
+
+    Valid formats: text and json
+
+    The records already queued are written before the format is changed.
+
+    :param log_format: The log format as a valid string.
+    """
+    if log_format == "json":
+        _listener.stop()
+        _stream_handler.setFormatter(JsonFormatter(datefmt="%Y-%m-%d %H:%M:%S"))
+        _listener.start()
+    elif log_format != "text":
+        logging.warning("%s is not a valid log format, defaulting to text.", log_format)
+
+
 def setup_logging():
+    """
+    Sets up logging through a queue, so that the writing of log lines is done
+    in a separate thread and does not block the caller.
+    """
+    global _listener
+
     formatter = Formatter(
-        fmt="%(asctime)s:%(levelname)s::%(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        fmt="%(asctime)s:%(levelname)s:%(context_str)s:%(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
     )
-    stream_handler = StreamHandler()
-    stream_handler.setFormatter(formatter)
+    _stream_handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = ContextQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+
+    _listener = QueueListener(log_queue, _stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
 
     logging.basicConfig(
         level=logging.INFO,
-        handlers=[stream_handler],
+        handlers=[queue_handler],
     )
@@ -0,0 +1,8 @@
+import os
+
+# Importing overleaf_backup loads the configuration, which requires these
+os.environ.setdefault("OVERLEAF_GIT_TOKEN", "test")
+os.environ.setdefault("OVERLEAF_USERNAME", "test")
+os.environ.setdefault("OVERLEAF_PASSWORD", "test")
+os.environ.setdefault("GITLAB_USERNAME", "test")
+os.environ.setdefault("GITLAB_ACCESS_TOKEN", "test")
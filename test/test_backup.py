@@ -0,0 +1,152 @@
+import os
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import json
+
+from overleaf_backup import config
+from overleaf_backup.backup import OverleafRepo, backup
+from overleaf_backup.checkpoint import Checkpoint, read_checkpoint
+
+
+def get_remote_url(repo_path: Path, remote_name: str) -> str:
+    return subprocess.run(
+        ["git", "-C", str(repo_path), "remote", "get-url", remote_name],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestOverleafRepo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clone_path = Path(self.tmp.name)
+        self.repo_path = self.clone_path / "abc"
+        subprocess.run(
+            ["git", "init", str(self.repo_path)], check=True, capture_output=True
+        )
+
+        # The git commands set the credentials in the environment
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_add_remote(self):
+        repo = OverleafRepo(
+            config, "abc", "https://gitlab.com/new/abc.git", self.clone_path
+        )
+
+        self.assertTrue(repo.add_remote())
+        self.assertEqual(
+            get_remote_url(self.repo_path, "backup"), "https://gitlab.com/new/abc.git"
+        )
+
+    def test_add_remote_changed_url(self):
+        OverleafRepo(
+            config, "abc", "https://gitlab.com/old/abc.git", self.clone_path
+        ).add_remote()
+        repo = OverleafRepo(
+            config, "abc", "https://gitlab.com/new/abc.git", self.clone_path
+        )
+
+        self.assertTrue(repo.add_remote())
+        self.assertEqual(
+            get_remote_url(self.repo_path, "backup"), "https://gitlab.com/new/abc.git"
+        )
+
+    def test_add_remote_missing_repo(self):
+        repo = OverleafRepo(
+            config, "missing", "https://gitlab.com/new/abc.git", self.clone_path
+        )
+
+        self.assertFalse(repo.add_remote())
+
+
+class TestBackupResume(unittest.TestCase):
+    PROJECTS = [
+        {"id": "a", "name": "Thesis"},
+        {"id": "b", "name": "Paper"},
+        {"id": "c", "name": "Notes"},
+    ]
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        clone_folder = Path(self.tmp.name)
+        self.checkpoint_file = clone_folder / "checkpoint.jsonl"
+
+        for target, value in [
+            ("overleaf_backup.backup.CLONE_FOLDER", clone_folder),
+            ("overleaf_backup.backup.CHECKPOINT_FILE", self.checkpoint_file),
+            ("overleaf_backup.backup.GitLab", mock.DEFAULT),
+            ("overleaf_backup.backup.maintain", mock.DEFAULT),
+        ]:
+            patcher = mock.patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # An interrupted run where a completed, b failed and c never ran
+        checkpoint = Checkpoint(self.checkpoint_file)
+        checkpoint.record("a", True)
+        checkpoint.record("b", False)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read_journal(self) -> list[dict]:
+        with open(self.checkpoint_file) as file:
+            return [json.loads(line) for line in file]
+
+    def backup(self, results: dict, resume: bool = True) -> list[str]:
+        backed_up = []
+
+        def backup_project(config, project, gitlab_url):
+            # The run is only marked as finished after all projects
+            self.assertNotIn({"status": "finished"}, self.read_journal())
+            backed_up.append(project["id"])
+            if isinstance(results[project["id"]], BaseException):
+                raise results[project["id"]]
+            return results[project["id"]]
+
+        with mock.patch(
+            "overleaf_backup.backup.__backup_project", side_effect=backup_project
+        ):
+            backup(config, self.PROJECTS, resume)
+
+        return backed_up
+
+    def test_resume(self):
+        backed_up = self.backup({"b": True, "c": False})
+
+        self.assertEqual(backed_up, ["b", "c"])
+        self.assertEqual(
+            self.read_journal(),
+            [
+                {"id": "a", "status": "completed"},
+                {"id": "b", "status": "completed"},
+                {"id": "c", "status": "failed"},
+                {"status": "finished"},
+            ],
+        )
+
+    def test_interrupted_resume(self):
+        with self.assertRaises(KeyboardInterrupt):
+            self.backup({"b": True, "c": KeyboardInterrupt()})
+
+        self.assertEqual(read_checkpoint(self.checkpoint_file), {"a", "b"})
+
+    def test_without_resume(self):
+        backed_up = self.backup({"a": True, "b": True, "c": True}, resume=False)
+
+        self.assertEqual(backed_up, ["a", "b", "c"])
+        self.assertEqual(len(self.read_journal()), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
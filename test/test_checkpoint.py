@@ -0,0 +1,72 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from overleaf_backup.checkpoint import Checkpoint, read_checkpoint
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "checkpoint.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_no_checkpoint(self):
+        self.assertEqual(read_checkpoint(self.path), set())
+
+    def test_round_trip(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.record("a", True)
+        checkpoint.record("b", False)
+
+        self.assertEqual(read_checkpoint(self.path), {"a"})
+
+    def test_finished_run(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.record("a", True)
+        checkpoint.finish()
+
+        self.assertEqual(read_checkpoint(self.path), set())
+
+    def test_last_entry_wins(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.record("a", True)
+        checkpoint.record("b", False)
+        checkpoint.record("a", False)
+        checkpoint.record("b", True)
+
+        self.assertEqual(read_checkpoint(self.path), {"b"})
+
+    def test_completed_are_carried_over(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.record("a", True)
+
+        checkpoint = Checkpoint(self.path, read_checkpoint(self.path))
+        checkpoint.record("b", True)
+
+        self.assertEqual(read_checkpoint(self.path), {"a", "b"})
+
+    def test_new_run_replaces_journal(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.record("a", True)
+
+        Checkpoint(self.path)
+
+        self.assertEqual(read_checkpoint(self.path), set())
+
+    def test_partial_last_line(self):
+        checkpoint = Checkpoint(self.path)
+        checkpoint.record("a", True)
+        checkpoint.record("b", True)
+
+        with open(self.path, "a") as file:
+            file.write('{"id": "c", "sta')
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(read_checkpoint(self.path), {"a", "b"})
+
+
+if __name__ == "__main__":
+    unittest.main()
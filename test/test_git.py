@@ -0,0 +1,117 @@
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from gitlab.exceptions import GitlabCreateError, GitlabGetError, GitlabListError
+
+from overleaf_backup.git import GitLab
+from overleaf_backup.utils.config import GitLabSettings
+from overleaf_backup.utils.logging import _log_context
+
+
+def make_project(name: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=1, name=name, http_url_to_repo=f"https://gitlab.com/backups/{name}.git"
+    )
+
+
+class FakeGitlab:
+    """
+    Minimal stand-in for gitlab.Gitlab with a single group 'parent/backups'.
+    """
+
+    def __init__(self, existing: list[str], list_error: Exception | None = None):
+        self.user = None
+        self.created = []
+        self.contexts = []
+
+        group = SimpleNamespace(
+            id=5,
+            full_path="parent/backups",
+            projects=SimpleNamespace(list=self.__list),
+        )
+        self.__existing = existing
+        self.__list_error = list_error
+
+        self.groups = SimpleNamespace(
+            get=lambda path, lazy=False: self.__group(path, group)
+        )
+        self.projects = SimpleNamespace(create=self.__create, get=self.__get)
+
+    def auth(self):
+        self.user = SimpleNamespace(id=3, username="user")
+
+    @staticmethod
+    def __group(path, group):
+        if path not in ("parent/backups", 5):
+            raise GitlabGetError("404 Group Not Found")
+        return group
+
+    def __list(self, iterator=False, **kwargs):
+        assert kwargs == {"with_shared": False}, kwargs
+        if self.__list_error:
+            raise self.__list_error
+        return [make_project(name) for name in self.__existing]
+
+    def __create(self, data):
+        self.contexts.append(_log_context.get())
+        if data["name"] in self.__existing:
+            raise GitlabCreateError(error_message={"name": ["has already been taken"]})
+        self.created.append(data["name"])
+        return make_project(data["name"])
+
+    def __get(self, path):
+        return make_project(path.split("/")[-1])
+
+
+def make_gitlab(fake: FakeGitlab) -> GitLab:
+    config = GitLabSettings(
+        username="user", access_token="token", group="parent/backups"
+    )
+    with mock.patch("gitlab.Gitlab", return_value=fake):
+        return GitLab(config)
+
+
+class TestGitLab(unittest.TestCase):
+    def test_group_exact_path(self):
+        gitlab_obj = make_gitlab(FakeGitlab([]))
+
+        self.assertEqual(gitlab_obj.group_exists("parent/backups"), 5)
+        with self.assertRaises(ValueError):
+            gitlab_obj.group_exists("backups")
+
+    def test_create_only_missing_projects(self):
+        fake = FakeGitlab(["a-Thesis"])
+        gitlab_obj = make_gitlab(fake)
+
+        urls = gitlab_obj.create_projects({"a": "a-Thesis", "b": "b-Paper"})
+
+        self.assertEqual(fake.created, ["b-Paper"])
+        self.assertEqual(
+            urls,
+            {
+                "a": "https://gitlab.com/backups/a-Thesis.git",
+                "b": "https://gitlab.com/backups/b-Paper.git",
+            },
+        )
+        self.assertEqual(fake.contexts, [{"project": "b", "phase": "create"}])
+
+    def test_list_error_falls_back_to_create(self):
+        fake = FakeGitlab(["a-Thesis"], list_error=GitlabListError("500"))
+        gitlab_obj = make_gitlab(fake)
+
+        urls = gitlab_obj.create_projects({"a": "a-Thesis", "b": "b-Paper"})
+
+        self.assertEqual(fake.created, ["b-Paper"])
+        self.assertEqual(urls["a"], "https://gitlab.com/backups/a-Thesis.git")
+        self.assertEqual(urls["b"], "https://gitlab.com/backups/b-Paper.git")
+
+    def test_list_error_without_fallback(self):
+        gitlab_obj = make_gitlab(FakeGitlab([], list_error=GitlabListError("500")))
+
+        with self.assertRaises(ValueError):
+            gitlab_obj.project_index(fallback=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
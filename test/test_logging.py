@@ -0,0 +1,59 @@
+import json
+import logging
+import queue
+import sys
+import unittest
+
+from overleaf_backup.utils.logging import (
+    ContextFilter,
+    ContextQueueHandler,
+    JsonFormatter,
+    log_context,
+)
+
+
+def make_record(msg: str, *args, exc_info=None) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.ERROR, __file__, 1, msg, args, exc_info)
+
+
+class TestLogContext(unittest.TestCase):
+    def test_nested_context(self):
+        record = make_record("message")
+
+        with log_context(project="abc"):
+            with log_context(phase="clone"):
+                ContextFilter().filter(record)
+
+        self.assertEqual(record.context, {"project": "abc", "phase": "clone"})
+        self.assertEqual(record.context_str, "project=abc phase=clone")
+
+    def test_context_is_reset(self):
+        with log_context(project="abc"):
+            pass
+
+        record = make_record("message")
+        ContextFilter().filter(record)
+
+        self.assertEqual(record.context, {})
+
+
+class TestJsonFormatter(unittest.TestCase):
+    def test_queued_record(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = make_record("failed %s", "abc", exc_info=sys.exc_info())
+
+        with log_context(project="abc"):
+            ContextFilter().filter(record)
+
+        prepared = ContextQueueHandler(queue.SimpleQueue()).prepare(record)
+        entry = json.loads(JsonFormatter().format(prepared))
+
+        self.assertEqual(entry["message"], "failed abc")
+        self.assertEqual(entry["project"], "abc")
+        self.assertIn("ValueError: boom", entry["exception"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import subprocess
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from overleaf_backup.maintenance import (
+    count_objects,
+    maintain,
+    maintain_repo,
+    needs_maintenance,
+)
+from overleaf_backup.utils.config import MaintenanceSettings
+
+
+def git(repo_path: Path, *args: str) -> None:
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            str(repo_path),
+            "-c",
+            "user.name=test",
+            "-c",
+            "user.email=test@test",
+            *args,
+        ],
+        check=True,
+        capture_output=True,
+    )
+
+
+def make_repo(repo_path: Path, commits: int) -> Path:
+    repo_path.mkdir(parents=True)
+    git(repo_path, "init")
+    for i in range(commits):
+        (repo_path / f"file{i}").write_text(str(i))
+        git(repo_path, "add", f"file{i}")
+        git(repo_path, "commit", "-m", str(i))
+    return repo_path
+
+
+class TestMaintenance(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_count_objects(self):
+        # Each commit adds a blob, a tree and a commit
+        stats = count_objects(make_repo(self.path / "repo", 2))
+
+        self.assertEqual(stats["count"], 6)
+        self.assertEqual(stats["packs"], 0)
+
+    def test_count_objects_not_a_repo(self):
+        self.assertEqual(count_objects(self.path), {})
+
+    def test_needs_maintenance(self):
+        config = MaintenanceSettings(loose_objects=10, packs=2)
+
+        self.assertFalse(needs_maintenance({"count": 9, "packs": 1}, config))
+        self.assertTrue(needs_maintenance({"count": 10, "packs": 0}, config))
+        self.assertTrue(needs_maintenance({"count": 0, "packs": 2}, config))
+        self.assertFalse(needs_maintenance({}, config))
+
+    def test_maintain_repo(self):
+        repo_path = make_repo(self.path / "repo", 3)
+
+        self.assertTrue(maintain_repo(repo_path, MaintenanceSettings()))
+
+        stats = count_objects(repo_path)
+        self.assertEqual(stats["count"], 0)
+        self.assertEqual(stats["packs"], 1)
+        self.assertTrue((repo_path / ".git/objects/pack/multi-pack-index").exists())
+        self.assertTrue((repo_path / ".git/objects/info/commit-graphs").exists())
+
+    def test_maintain_repo_past_deadline(self):
+        repo_path = make_repo(self.path / "repo", 3)
+
+        self.assertFalse(
+            maintain_repo(repo_path, MaintenanceSettings(), time.monotonic())
+        )
+        self.assertEqual(count_objects(repo_path)["count"], 9)
+
+    def test_maintain_order_and_thresholds(self):
+        make_repo(self.path / "small", 1)
+        make_repo(self.path / "large", 3)
+        make_repo(self.path / "below", 0)
+        (self.path / "checkpoint.jsonl").write_text("")
+
+        with mock.patch(
+            "overleaf_backup.maintenance.maintain_repo", return_value=True
+        ) as maintain_repo_mock:
+            maintain(MaintenanceSettings(loose_objects=3), self.path)
+
+        self.assertEqual(
+            [call.args[0].name for call in maintain_repo_mock.call_args_list],
+            ["large", "small"],
+        )
+
+    def test_maintain_stops_at_time_budget(self):
+        make_repo(self.path / "first", 2)
+        make_repo(self.path / "second", 1)
+        deadlines = []
+
+        def slow_maintain_repo(repo_path, config, deadline):
+            deadlines.append(deadline)
+            time.sleep(1.1)
+            return False
+
+        start = time.monotonic()
+        with mock.patch(
+            "overleaf_backup.maintenance.maintain_repo", side_effect=slow_maintain_repo
+        ):
+            maintain(MaintenanceSettings(loose_objects=0, time_budget=1), self.path)
+
+        self.assertEqual(len(deadlines), 1)
+        self.assertAlmostEqual(deadlines[0], start + 1, delta=0.1)
+
+    def test_maintain_time_budget(self):
+        make_repo(self.path / "repo", 1)
+
+        with mock.patch(
+            "overleaf_backup.maintenance.maintain_repo", return_value=True
+        ) as maintain_repo_mock:
+            maintain(MaintenanceSettings(loose_objects=0, time_budget=0), self.path)
+
+        maintain_repo_mock.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from overleaf_backup import config
+from overleaf_backup.backup import unique_projects
+from overleaf_backup.overleaf import read_project_list
+from overleaf_backup.plan import (
+    API_REQUEST_SECONDS,
+    DEFAULT_REPO_BYTES,
+    GIT_COMMAND_SECONDS,
+    TRANSFER_BYTES_PER_SECOND,
+    create_plan,
+    repo_size,
+    save_plan,
+)
+
+PROJECTS = [
+    {"id": "a", "name": "Thesis"},
+    {"id": "b", "name": "Paper"},
+    {"id": "a", "name": "Thesis"},
+]
+
+
+class TestPlan(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.clone_folder = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def create_plan(
+        self,
+        gitlab_index: dict,
+        gitlab_error: Exception | None = None,
+        completed: set[str] | None = None,
+    ) -> dict:
+        with (
+            mock.patch("overleaf_backup.plan.CLONE_FOLDER", self.clone_folder),
+            mock.patch("overleaf_backup.plan.GitLab") as gitlab_mock,
+        ):
+            project_index = gitlab_mock.return_value.project_index
+            project_index.return_value = gitlab_index
+            project_index.side_effect = gitlab_error
+
+            plan = create_plan(config, PROJECTS, completed)
+
+        project_index.assert_called_once_with(fallback=False)
+        return plan
+
+    def test_new_projects(self):
+        plan = self.create_plan({})
+
+        self.assertEqual(
+            [project["actions"] for project in plan["projects"]],
+            [["create", "clone", "push"], ["create", "clone", "push"]],
+        )
+        # Cloned from Overleaf and pushed to the new GitLab project
+        self.assertEqual(plan["projects"][0]["transfer_bytes"], 2 * DEFAULT_REPO_BYTES)
+
+    def test_existing_projects(self):
+        subprocess.run(
+            ["git", "init", str(self.clone_folder / "a")],
+            check=True,
+            capture_output=True,
+        )
+        (self.clone_folder / "a/file").write_text("content")
+        subprocess.run(
+            ["git", "-C", str(self.clone_folder / "a"), "add", "file"], check=True
+        )
+
+        plan = self.create_plan({"a-Thesis": "https://gitlab.com/a-Thesis.git"})
+        size = repo_size(self.clone_folder / "a")
+
+        self.assertGreater(size, 0)
+        self.assertEqual(plan["projects"][0]["actions"], ["pull", "push"])
+        self.assertEqual(plan["projects"][0]["transfer_bytes"], 0)
+        # New clones are estimated from the local clones
+        self.assertEqual(plan["projects"][1]["actions"], ["create", "clone", "push"])
+        self.assertEqual(plan["projects"][1]["transfer_bytes"], 2 * size)
+
+    def test_duplicates_are_skipped(self):
+        plan = self.create_plan({})
+
+        self.assertEqual(
+            [project["id"] for project in plan["projects"]],
+            [project["id"] for project in unique_projects(PROJECTS)],
+        )
+        self.assertEqual(plan["skipped"][0]["reason"], "duplicate")
+
+    def test_summary(self):
+        plan = self.create_plan({})
+        summary = plan["summary"]
+
+        self.assertEqual(
+            summary["actions"],
+            {"create": 2, "clone": 2, "pull": 0, "push": 2, "skip": 1},
+        )
+        self.assertEqual(summary["transfer_bytes"], 4 * DEFAULT_REPO_BYTES)
+        self.assertEqual(
+            summary["estimated_seconds"],
+            round(
+                2 * API_REQUEST_SECONDS / config.gitlab.max_workers
+                + 4 * GIT_COMMAND_SECONDS
+                + 4 * DEFAULT_REPO_BYTES / TRANSFER_BYTES_PER_SECOND
+            ),
+        )
+
+    def test_completed_are_skipped(self):
+        plan = self.create_plan({}, completed={"a"})
+
+        self.assertEqual([project["id"] for project in plan["projects"]], ["b"])
+        self.assertEqual(
+            [(project["id"], project["reason"]) for project in plan["skipped"]],
+            [("a", "completed"), ("a", "duplicate")],
+        )
+        self.assertEqual(plan["summary"]["actions"]["skip"], 2)
+
+    def test_gitlab_list_error(self):
+        with self.assertRaises(ValueError):
+            self.create_plan({}, ValueError("Unable to list projects"))
+
+    def test_plan_as_project_list(self):
+        plan = self.create_plan({})
+        path = self.clone_folder / "plan.json"
+
+        self.assertTrue(save_plan(plan, str(path)))
+        self.assertEqual(
+            read_project_list(str(path)),
+            plan["projects"],
+        )
+        self.assertEqual(
+            [project["id"] for project in read_project_list(str(path))], ["a", "b"]
+        )
+
+
+class TestUniqueProjects(unittest.TestCase):
+    def test_keeps_first(self):
+        projects = [
+            {"id": "a", "name": "First"},
+            {"id": "b", "name": "Paper"},
+            {"id": "a", "name": "Second"},
+        ]
+
+        self.assertEqual(unique_projects(projects), projects[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()